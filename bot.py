@@ -7,12 +7,41 @@ import os
 import re
 import sys
 import time
+from collections import deque
+from collections.abc import Iterable
 from logging.handlers import RotatingFileHandler
 
 # Third-party imports
 import discord
 from openai import OpenAI
 
+# Configuration keys per section, used to build the configuration from
+# environment variables when no configuration file is available.
+CONFIG_SCHEMA = (
+    ('Discord', (
+        'DISCORD_TOKEN', 'ALLOWED_CHANNELS', 'BOT_PRESENCE', 'ACTIVITY_TYPE', 'ACTIVITY_STATUS'
+    )),
+    ('Default', (
+        'API_KEY', 'API_URL', 'GPT_MODEL', 'INPUT_TOKENS', 'OUTPUT_TOKENS', 'CONTEXT_WINDOW',
+        'SYSTEM_MESSAGE'
+    )),
+    ('Limits', ('RATE_LIMIT', 'RATE_LIMIT_PER', 'MAX_HISTORY')),
+    ('Logging', ('LOG_FILE', 'LOG_LEVEL')),
+)
+
+# Matches user mentions, which are stripped from channel messages
+MENTION_PATTERN = re.compile(r'<@\d+>')
+
+# Supported ACTIVITY_TYPE values and their discord activity types
+ACTIVITY_TYPES = {
+    'playing': discord.ActivityType.playing,
+    'streaming': discord.ActivityType.streaming,
+    'listening': discord.ActivityType.listening,
+    'watching': discord.ActivityType.watching,
+    'custom': discord.ActivityType.custom,
+    'competing': discord.ActivityType.competing
+}
+
 
 class RateLimiter:
     """Class to handle rate limiting for users."""
@@ -41,11 +70,14 @@ class RateLimiter:
         Returns:
             bool: True if the user is within the rate limit, False otherwise.
         """
-        current_time = time.time()
-        last_command_timestamp = self.last_command_timestamps.get(user_id, 0)
+        current_time = time.monotonic()
+        last_command_timestamp = self.last_command_timestamps.get(user_id)
         last_command_count_user = self.last_command_count.get(user_id, 0)
 
-        if current_time - last_command_timestamp > rate_limit_per:
+        if (
+            last_command_timestamp is None
+            or current_time - last_command_timestamp > rate_limit_per
+        ):
             self.last_command_timestamps[user_id] = current_time
             self.last_command_count[user_id] = 1
             logger.info(f"Rate limit passed for user: {user_id}")
@@ -77,17 +109,23 @@ def load_configuration(config_file: str) -> configparser.ConfigParser:
     Load the configuration from a file or environment variables.
 
     Args:
-        config_file (str): Path to the configuration file.
+        config_file (str): Path to the configuration file. If it is not set or does not
+            exist, the keys listed in CONFIG_SCHEMA are read from environment variables.
 
     Returns:
         configparser.ConfigParser: Loaded configuration.
     """
     config = configparser.ConfigParser()
 
-    if os.path.exists(config_file):
+    if config_file and os.path.exists(config_file):
         config.read(config_file)
     else:
-        config.read_dict({section: dict(os.environ) for section in config.sections()})
+        # Escape '%' so free-text values such as SYSTEM_MESSAGE are not interpolated
+        environ = os.environ
+        for section, keys in CONFIG_SCHEMA:
+            config[section] = {
+                key: environ[key].replace('%', '%%') for key in keys if key in environ
+            }
 
     return config
 
@@ -103,37 +141,38 @@ def set_activity_status(activity_type: str, activity_status: str) -> discord.Act
     Returns:
         discord.Activity: The activity object.
     """
-    activity_types = {
-        'playing': discord.ActivityType.playing,
-        'streaming': discord.ActivityType.streaming,
-        'listening': discord.ActivityType.listening,
-        'watching': discord.ActivityType.watching,
-        'custom': discord.ActivityType.custom,
-        'competing': discord.ActivityType.competing
-    }
     return discord.Activity(
-        type=activity_types.get(activity_type, discord.ActivityType.listening),
+        type=ACTIVITY_TYPES.get(activity_type, discord.ActivityType.listening),
         name=activity_status
     )
 
 
-def get_conversation_summary(conversation: list[dict]) -> list[dict]:
+def get_conversation_summary(conversation: Iterable[dict]) -> list[dict]:
     """
     Get a summary of the conversation.
 
+    Each assistant response is paired with the most recent user message before it,
+    in a single pass over the history. User messages that never got a response and
+    messages with any other role are left out.
+
     Args:
-        conversation (list[dict]): The conversation history.
+        conversation (Iterable[dict]): The conversation history, oldest message first,
+            such as a user's deque from CONVERSATION_HISTORY.
 
     Returns:
         list[dict]: The summarized conversation.
     """
     summary = []
-    user_messages = [msg for msg in conversation if msg["role"] == "user"]
-    assistant_responses = [msg for msg in conversation if msg["role"] == "assistant"]
+    user_msg = None
 
-    for user_msg, assistant_resp in zip(user_messages, assistant_responses):
-        summary.append(user_msg)
-        summary.append(assistant_resp)
+    for msg in conversation:
+        role = msg["role"]
+        if role == "user":
+            user_msg = msg
+        elif role == "assistant" and user_msg is not None:
+            summary.append(user_msg)
+            summary.append(msg)
+            user_msg = None
 
     return summary
 
@@ -182,9 +221,6 @@ async def process_input_message(
     """
     logger.info("Sending prompt to the API.")
 
-    conversation = CONVERSATION_HISTORY.get(user.id, [])
-    conversation.append({"role": "user", "content": input_message})
-
     def call_openai_api():
         logger.debug(f"GPT_MODEL: {GPT_MODEL}")
         logger.debug(f"SYSTEM_MESSAGE: {SYSTEM_MESSAGE}")
@@ -218,8 +254,13 @@ async def process_input_message(
         logger.info("Received response from the API.")
         logger.info(f"Sent the response: {response_content}")
 
-        conversation.append({"role": "assistant", "content": response_content})
-        CONVERSATION_HISTORY[user.id] = conversation
+        conversation = CONVERSATION_HISTORY.get(user.id)
+        if conversation is None:
+            conversation = CONVERSATION_HISTORY[user.id] = deque(maxlen=MAX_HISTORY)
+        conversation.extend((
+            {"role": "user", "content": input_message},
+            {"role": "assistant", "content": response_content}
+        ))
 
         return response_content
     else:
@@ -236,6 +277,10 @@ async def process_dm_message(message: discord.Message):
     """
     logger.info(f'Received DM from {message.author}: {message.content}')
 
+    if not MENTION_PATTERN.sub('', message.content).strip():
+        logger.info(f'Ignoring empty DM from {message.author}')
+        return
+
     if not await check_rate_limit(message.author, rate_limiter, RATE_LIMIT, RATE_LIMIT_PER):
         await message.channel.send(
             f"{message.author.mention} Exceeded the Rate Limit! Please slow down!"
@@ -259,14 +304,19 @@ async def process_channel_message(message: discord.Message):
     Args:
         message (discord.Message): The message received in a channel.
     """
+    content = MENTION_PATTERN.sub('', message.content)
     logger.info(
         'Received message in {} from {}: {}'.format(
             str(message.channel),
             str(message.author),
-            re.sub(r'<@\d+>', '', message.content)
+            content
         )
     )
 
+    if not content.strip():
+        logger.info(f'Ignoring empty message in {message.channel} from {message.author}')
+        return
+
     if not await check_rate_limit(message.author, rate_limiter, RATE_LIMIT, RATE_LIMIT_PER):
         await message.channel.send(
             f"{message.author.mention} Exceeded the Rate Limit! Please slow down!"
@@ -347,6 +397,9 @@ if __name__ == "__main__":  # noqa: C901 (ignore complexity in main function)
         'Default', 'SYSTEM_MESSAGE', fallback='You are a helpful assistant.')
     RATE_LIMIT = config.getint('Limits', 'RATE_LIMIT', fallback=10)
     RATE_LIMIT_PER = config.getint('Limits', 'RATE_LIMIT_PER', fallback=60)
+    MAX_HISTORY = config.getint('Limits', 'MAX_HISTORY', fallback=50)
+    if MAX_HISTORY < 0:
+        sys.exit(f"Invalid MAX_HISTORY {MAX_HISTORY}: must be zero or greater")
     LOG_FILE = config.get('Logging', 'LOG_FILE', fallback='bot.log')
     LOG_LEVEL = config.get('Logging', 'LOG_LEVEL', fallback='INFO')
 
@@ -376,7 +429,8 @@ if __name__ == "__main__":  # noqa: C901 (ignore complexity in main function)
     intents.typing = False
     intents.presences = False
 
-    # Create a dictionary to store conversation history for each user
+    # Create a dictionary to store conversation history for each user, each history
+    # being a deque that drops its oldest messages once MAX_HISTORY is reached
     CONVERSATION_HISTORY = {}
 
     # Create the bot instance
@@ -28,7 +28,7 @@ def run_test(user, rate_limiter):
     assert rate_limiter.last_command_count.get(user.id, 0) == RATE_LIMIT
 
     # Simulate time passing to reset rate limit
-    rate_limiter.last_command_timestamps[user.id] = time.time() - RATE_LIMIT_PER - 1
+    rate_limiter.last_command_timestamps[user.id] = time.monotonic() - RATE_LIMIT_PER - 1
     result = rate_limiter.check_rate_limit(user.id, RATE_LIMIT, RATE_LIMIT_PER, logger)
     assert result is True
     assert rate_limiter.last_command_count.get(user.id, 0) == 1
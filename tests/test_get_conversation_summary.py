@@ -1,21 +1,27 @@
+import pytest
 from bot import get_conversation_summary
 
+HELLO = {"role": "user", "content": "Hello"}
+HI_THERE = {"role": "assistant", "content": "Hi there!"}
+ARE_YOU_THERE = {"role": "user", "content": "Are you there?"}
+HOW_ARE_YOU = {"role": "user", "content": "How are you?"}
+DOING_WELL = {"role": "assistant", "content": "I'm doing well, thank you!"}
+GOODBYE = {"role": "user", "content": "Goodbye"}
+SYSTEM = {"role": "system", "content": "You are a helpful assistant."}
 
-def test_get_conversation_summary():
-    conversation = [
-        {"role": "user", "content": "Hello"},
-        {"role": "assistant", "content": "Hi there!"},
-        {"role": "user", "content": "How are you?"},
-        {"role": "assistant", "content": "I'm doing well, thank you!"}
-    ]
+CONVERSATION = (HELLO, HI_THERE, HOW_ARE_YOU, DOING_WELL)
+CONVERSATION_WITH_UNANSWERED = (
+    HELLO, HI_THERE, ARE_YOU_THERE, HOW_ARE_YOU, DOING_WELL, GOODBYE
+)
+CONVERSATION_WITHOUT_USER = (SYSTEM, HI_THERE)
 
-    expected_summary = [
-        {"role": "user", "content": "Hello"},
-        {"role": "assistant", "content": "Hi there!"},
-        {"role": "user", "content": "How are you?"},
-        {"role": "assistant", "content": "I'm doing well, thank you!"}
-    ]
 
-    summary = get_conversation_summary(conversation)
+@pytest.mark.parametrize("conversation, expected_summary", [
+    (CONVERSATION, CONVERSATION),
+    (CONVERSATION_WITH_UNANSWERED, CONVERSATION),
+    (CONVERSATION_WITHOUT_USER, ())
+], ids=["alternating", "unanswered_message", "without_user_message"])
+def test_get_conversation_summary(conversation, expected_summary):
+    summary = get_conversation_summary(list(conversation))
 
-    assert summary == expected_summary
+    assert summary == list(expected_summary)
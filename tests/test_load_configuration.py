@@ -0,0 +1,30 @@
+from bot import load_configuration
+
+
+def test_load_configuration_from_file(tmp_path):
+    config_file = tmp_path / "config.ini"
+    config_file.write_text(
+        "[Discord]\n"
+        "DISCORD_TOKEN = file_token\n"
+        "[Limits]\n"
+        "RATE_LIMIT = 5\n"
+    )
+
+    config = load_configuration(str(config_file))
+
+    assert config.get('Discord', 'DISCORD_TOKEN') == "file_token"
+    assert config.getint('Limits', 'RATE_LIMIT') == 5
+
+
+def test_load_configuration_from_environment(monkeypatch):
+    monkeypatch.setenv("DISCORD_TOKEN", "env_token")
+    monkeypatch.setenv("RATE_LIMIT", "3")
+    monkeypatch.setenv("SYSTEM_MESSAGE", "Be 100% honest")
+    monkeypatch.delenv("RATE_LIMIT_PER", raising=False)
+
+    config = load_configuration(None)
+
+    assert config.get('Discord', 'DISCORD_TOKEN') == "env_token"
+    assert config.getint('Limits', 'RATE_LIMIT') == 3
+    assert config.get('Default', 'SYSTEM_MESSAGE') == "Be 100% honest"
+    assert config.getint('Limits', 'RATE_LIMIT_PER', fallback=60) == 60
@@ -0,0 +1,56 @@
+import logging
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+import bot
+from bot import process_input_message
+
+MAX_HISTORY = 4
+
+
+@pytest.fixture
+def history(monkeypatch):
+    conversation_history = {}
+    monkeypatch.setattr(bot, "CONVERSATION_HISTORY", conversation_history, raising=False)
+    monkeypatch.setattr(bot, "MAX_HISTORY", MAX_HISTORY, raising=False)
+    monkeypatch.setattr(bot, "GPT_MODEL", "gpt-4o-mini", raising=False)
+    monkeypatch.setattr(bot, "SYSTEM_MESSAGE", "You are a helpful assistant.", raising=False)
+    monkeypatch.setattr(bot, "OUTPUT_TOKENS", 8000, raising=False)
+    monkeypatch.setattr(bot, "logger", logging.getLogger('pytest_logger'), raising=False)
+    return conversation_history
+
+
+def mock_client(monkeypatch, content):
+    client = MagicMock()
+    client.chat.completions.create.return_value.choices[0].message.content = content
+    monkeypatch.setattr(bot, "client", client, raising=False)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_process_input_message_caps_history(monkeypatch, history):
+    user = AsyncMock()
+    user.id = 123
+    mock_client(monkeypatch, "Reply")
+
+    for i in range(3):
+        response = await process_input_message(f"Message {i}", user, [])
+        assert response == "Reply"
+
+    assert list(history[user.id]) == [
+        {"role": "user", "content": "Message 1"},
+        {"role": "assistant", "content": "Reply"},
+        {"role": "user", "content": "Message 2"},
+        {"role": "assistant", "content": "Reply"}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_process_input_message_without_response(monkeypatch, history):
+    user = AsyncMock()
+    user.id = 123
+    mock_client(monkeypatch, "   ")
+
+    response = await process_input_message("Hello", user, [])
+
+    assert response == "Sorry, I didn't get that. Can you rephrase or ask again?"
+    assert user.id not in history
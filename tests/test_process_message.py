@@ -0,0 +1,51 @@
+import logging
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+import bot
+from bot import process_channel_message, process_dm_message
+
+
+@pytest.fixture
+def handlers(monkeypatch):
+    mocks = {
+        "rate_limiter": MagicMock(),
+        "check_rate_limit": AsyncMock(return_value=True),
+        "process_input_message": AsyncMock(return_value="Reply")
+    }
+    for name, mock in mocks.items():
+        monkeypatch.setattr(bot, name, mock, raising=False)
+    monkeypatch.setattr(bot, "RATE_LIMIT", 10, raising=False)
+    monkeypatch.setattr(bot, "RATE_LIMIT_PER", 60, raising=False)
+    monkeypatch.setattr(bot, "CONVERSATION_HISTORY", {}, raising=False)
+    monkeypatch.setattr(bot, "logger", logging.getLogger('pytest_logger'), raising=False)
+    return mocks
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("process_message", [process_dm_message, process_channel_message])
+@pytest.mark.parametrize("content", ["", "   ", "<@123>", " <@123> \n"],
+                         ids=["empty", "whitespace", "mention", "mention_whitespace"])
+async def test_process_message_ignores_empty_content(handlers, process_message, content):
+    message = MagicMock()
+    message.content = content
+    message.channel.send = AsyncMock()
+
+    await process_message(message)
+
+    handlers["check_rate_limit"].assert_not_called()
+    handlers["rate_limiter"].check_rate_limit.assert_not_called()
+    handlers["process_input_message"].assert_not_called()
+    message.channel.send.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("process_message", [process_dm_message, process_channel_message])
+async def test_process_message_replies_to_content(handlers, process_message):
+    message = MagicMock()
+    message.content = "<@123> Hello"
+    message.channel.send = AsyncMock()
+
+    await process_message(message)
+
+    handlers["check_rate_limit"].assert_awaited_once()
+    message.channel.send.assert_awaited_once_with("Reply")
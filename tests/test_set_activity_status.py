@@ -0,0 +1,20 @@
+import discord
+import pytest
+from bot import set_activity_status
+
+
+@pytest.mark.parametrize("activity_type, expected_type", [
+    ("playing", discord.ActivityType.playing),
+    ("streaming", discord.ActivityType.streaming),
+    ("listening", discord.ActivityType.listening),
+    ("watching", discord.ActivityType.watching),
+    ("custom", discord.ActivityType.custom),
+    ("competing", discord.ActivityType.competing),
+    ("invalid", discord.ActivityType.listening)
+])
+def test_set_activity_status(activity_type, expected_type):
+    activity = set_activity_status(activity_type, "Humans")
+
+    assert isinstance(activity, discord.Activity)
+    assert activity.type == expected_type
+    assert activity.name == "Humans"